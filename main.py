@@ -1,4 +1,5 @@
 import asyncio
+import numpy as np
 from pixoo import DivoomPixoo64, Pixoo64Animation
 
 async def test_pixel_buffer(display: DivoomPixoo64) -> None:
@@ -123,10 +124,13 @@ async def test_swiss_flag(display: DivoomPixoo64) -> None:
     v_start = center_y - v_length // 2     # 32 - 20 = 12
     v_end = center_y + v_length // 2       # 32 + 20 = 52
     
+    # Build the cross as one mask so the overlapping center is drawn only once
+    cross = np.zeros((64, 64), dtype=bool)
     # Vertical bar
-    display.draw_rectangle(h_start, v_start, h_end, v_end, (255, 255, 255), fill_color=(255, 255, 255))
+    cross[v_start:v_end + 1, h_start:h_end + 1] = True
     # Horizontal bar
-    display.draw_rectangle(v_start, h_start, v_end, h_end, (255, 255, 255), fill_color=(255, 255, 255))
+    cross[h_start:h_end + 1, v_start:v_end + 1] = True
+    display.blit_mask(cross, (255, 255, 255))
     
     await display.flush_buffer()
     await asyncio.sleep(3)
@@ -160,7 +164,10 @@ async def main() -> None:
     # Create display client
     #display = DivoomPixoo64("localhost", port=8079)
     display = DivoomPixoo64("192.168.1.130", port=80, initial_pic_id=401)
-    await run_commands(display)
+    try:
+        await run_commands(display)
+    finally:
+        await display.close()
 
 
 if __name__ == "__main__":
@@ -5,56 +5,106 @@ This module provides functionality to control a Divoom Pixoo64 display device,
 including drawing primitives, animations, and device control commands.
 """
 
-from typing import List, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 
+import asyncio
 import aiohttp
 import base64
+import logging
 
+import numpy as np
+import orjson
 from PIL import Image, ImageSequence
 
+logger = logging.getLogger(__name__)
+
 
 class Pixoo64Animation:
     """
     Represents an animated GIF for the Pixoo64 device.
     
-    Contains properties that remain constant across all commands.
+    Contains properties that remain constant across all commands. The frames
+    are stored as an immutable tuple; assign a new sequence to encoded_frames
+    to replace them.
     """
     
-    def __init__(self, encoded_frames: List[bytes], frame_delay: int, pic_width: int):
+    def __init__(self, encoded_frames: Sequence[bytes], frame_delay: int, pic_width: int):
         """
         Initialize the animated image.
         
         Args:
-            encoded_frames: List of encoded frame data
+            encoded_frames: Sequence of encoded frame data
             frame_delay: Delay between frames in milliseconds
             pic_width: Width of the image
         """
+        self._encoded_b64: Optional[List[str]] = None
         self.encoded_frames = encoded_frames
         self.frame_delay = frame_delay
         self.pic_width = pic_width
 
+    @property
+    def encoded_frames(self) -> Tuple[bytes, ...]:
+        """Encoded frame data."""
+        return self._encoded_frames
+
+    @encoded_frames.setter
+    def encoded_frames(self, encoded_frames: Sequence[bytes]) -> None:
+        # New frames invalidate the cached base64 encoding
+        self._encoded_frames = tuple(encoded_frames)
+        self._encoded_b64 = None
+
+    async def get_encoded_b64(self) -> List[str]:
+        """
+        Get the base64 encoded frames as sent in PicData.
+        
+        Encoding runs once in a worker thread and the result is cached, so
+        displaying the same animation again does not encode the frames again.
+        
+        Returns:
+            List of base64 encoded frame data
+        """
+        if self._encoded_b64 is not None:
+            return self._encoded_b64
+        frames = self._encoded_frames
+        loop = asyncio.get_running_loop()
+        encoded_b64 = await loop.run_in_executor(None, self._encode_b64, frames)
+        # Only cache if the frames were not replaced while encoding
+        if frames is self._encoded_frames:
+            self._encoded_b64 = encoded_b64
+        return encoded_b64
+
+    @staticmethod
+    def _encode_b64(encoded_frames: Sequence[bytes]) -> List[str]:
+        """Base64 encode each frame."""
+        return [base64.b64encode(frame).decode('ascii') for frame in encoded_frames]
+
     @classmethod
-    def load_from_gif(cls, gif_path: str, pic_width: int = 64) -> 'Pixoo64Animation':
+    def load_from_gif(cls, gif_path: str, pic_width: int = 64,
+                      resample: Image.Resampling = Image.Resampling.BILINEAR) -> 'Pixoo64Animation':
         """
         Load encoded frames and frame delay from a GIF file.
         
         Args:
             gif_path: Path to the GIF file
             pic_width: Width to resize the image to (default: 64)
+            resample: Resampling filter (default: BILINEAR, use NEAREST for pixel art)
             
         Returns:
             Pixoo64Animation instance
         """
+        size = (pic_width, pic_width)
         with Image.open(gif_path) as img:
             encoded_frames = []
             for frame in ImageSequence.Iterator(img):
-                # Scale frame to pic_width x pic_width pixels
-                frame = frame.resize((pic_width, pic_width), Image.Resampling.LANCZOS)
-                # Convert frame to RGB format and then to bytes
-                frame_rgb = frame.convert('RGB')
-                frame_data = frame_rgb.tobytes()
-                print(f"Frame data length: {len(frame_data)}")
-                encoded_frames.append(frame_data)
+                if resample == Image.Resampling.NEAREST:
+                    # Picking pixels works on palette indices too: scale first, convert the small frame
+                    frame_rgb = frame.resize(size, resample).convert('RGB')
+                else:
+                    # PIL only applies real filters to RGB data (palette images fall back to NEAREST)
+                    frame_rgb = frame.convert('RGB')
+                    if frame_rgb.size != size:
+                        frame_rgb = frame_rgb.resize(size, resample)
+                encoded_frames.append(frame_rgb.tobytes())
             frame_delay = img.info.get('duration', 100)  # Default to 100 ms if not specified
         return cls(encoded_frames, frame_delay, pic_width)
 
@@ -62,6 +112,8 @@ class Pixoo64Animation:
 class DivoomPixoo64:
     """Divoom Pixoo64 display controller with drawing capabilities."""
     
+    _HEADERS = {'Content-Type': 'application/json'}
+    
     def __init__(self, ip_address: str, port: int = 80, initial_pic_id: int = 0):
         """
         Initialize the Divoom Pixoo64 client.
@@ -73,13 +125,44 @@ class DivoomPixoo64:
         """
         self.ip_address = ip_address
         self.base_url = f"http://{ip_address}:{port}"
+        self._post_url = f"{self.base_url}/post"
         self._pixel_count_xy = 64
         self._current_pic_id = initial_pic_id
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Last flushed frame and its base64 encoding, reused while the buffer is unchanged
+        self._last_frame_data: Optional[bytes] = None
+        self._last_frame_b64 = ''
         self._init_buffer()
         
     def _init_buffer(self) -> None:
-        """Initialize the internal frame buffer."""
-        self._buffer = Image.new('RGB', (self._pixel_count_xy, self._pixel_count_xy), (0, 0, 0))
+        """
+        Initialize the internal frame buffer.
+        
+        Each pixel is stored as one little-endian uint32 (R, G, B, padding), so a
+        pixel is written with a single store instead of three byte stores.
+        """
+        self._buffer = np.zeros((self._pixel_count_xy, self._pixel_count_xy), dtype='<u4')
+
+    @staticmethod
+    def _pack_color(color: Tuple[int, int, int]) -> np.uint32:
+        """
+        Pack an (R, G, B) tuple into the buffer's uint32 pixel format.
+        
+        Drawing primitives call this once per color, so every store into the
+        buffer takes a ready NumPy scalar instead of converting the tuple again.
+        
+        Raises:
+            ValueError: If a color component is outside 0-255
+        """
+        r, g, b = (int(c) for c in color)
+        if not (0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255):
+            raise ValueError(f"Color components out of range: {color}")
+        return np.uint32(r | (g << 8) | (b << 16) | 0xFF000000)
+
+    def _frame_bytes(self) -> bytes:
+        """Get the buffer as packed RGB24 bytes, as expected by the device."""
+        n = self._pixel_count_xy
+        return self._buffer.view(np.uint8).reshape(n, n, 4)[..., :3].tobytes()
 
     def _get_next_pic_id(self) -> int:
         """Get the next available pic_id."""
@@ -96,10 +179,10 @@ class DivoomPixoo64:
             color: (R, G, B) tuple
             
         Raises:
-            ValueError: If coordinates are out of bounds
+            ValueError: If coordinates or color components are out of bounds
         """
         if 0 <= x < self._pixel_count_xy and 0 <= y < self._pixel_count_xy:
-            self._buffer.putpixel((x, y), color)
+            self._buffer[y, x] = self._pack_color(color)
         else:
             raise ValueError(f"Pixel coordinates out of bounds: ({x}, {y})")
 
@@ -110,7 +193,28 @@ class DivoomPixoo64:
         Args:
             color: (R, G, B) tuple (default: black)
         """
-        self._buffer.paste(color, (0, 0, self._pixel_count_xy, self._pixel_count_xy))
+        self._buffer.fill(self._pack_color(color))
+
+    def blit_mask(self, mask: np.ndarray, color: Tuple[int, int, int]) -> None:
+        """
+        Set all pixels selected by a boolean mask to a single color.
+        
+        Shapes built from several overlapping parts can be combined into one
+        mask first, so every pixel is written only once.
+        
+        Args:
+            mask: Boolean array of shape (64, 64), indexed as [y, x]
+            color: (R, G, B) tuple
+            
+        Raises:
+            ValueError: If the mask is not boolean or its shape does not match the display
+        """
+        if mask.dtype != bool:
+            # Integer arrays would be taken as row indices, not as a mask
+            raise ValueError(f"Mask must be a boolean array, got dtype {mask.dtype}")
+        if mask.shape != self._buffer.shape:
+            raise ValueError(f"Mask shape {mask.shape} does not match display {self._buffer.shape}")
+        self._buffer[mask] = self._pack_color(color)
 
     async def flush_buffer(self, pic_id: Optional[int] = None, frame_delay: int = 100) -> None:
         """
@@ -122,36 +226,85 @@ class DivoomPixoo64:
         """
         if pic_id is None:
             pic_id = self._get_next_pic_id()
-        frame_data = self._buffer.tobytes()
-        animation = Pixoo64Animation([frame_data], frame_delay, self._pixel_count_xy)
-        await self.display_animation(animation, pic_id)
+        frame_data = self._frame_bytes()
+        if frame_data != self._last_frame_data:
+            self._last_frame_data = frame_data
+            self._last_frame_b64 = base64.b64encode(frame_data).decode('ascii')
+        # Single frame: build the Draw/SendHttpGif payload directly, no Pixoo64Animation needed
+        payload = {
+            "Command": "Draw/SendHttpGif",
+            "PicNum": 1,
+            "PicWidth": self._pixel_count_xy,
+            "PicOffset": 0,
+            "PicID": pic_id,
+            "PicSpeed": frame_delay,
+            "PicData": self._last_frame_b64
+        }
+        await self.send_command(payload, parse_response=False)
 
-    async def send_command(self, payload: dict) -> dict:
+    async def send_command(self, payload: dict, parse_response: bool = True) -> dict:
         """
         Send a command to the device.
         
         Args:
             payload: Command payload to send
+            parse_response: Decode the JSON response (default: True). If False,
+                only {'success': bool} based on the HTTP status is returned.
+            
+        Returns:
+            Response from the device
+        """
+        logger.debug("Payload: %s", payload)
+        return await self._post(self._encode_payload(payload), parse_response)
+
+    @staticmethod
+    def _encode_payload(payload: dict) -> bytes:
+        """Serialize a command payload to a JSON request body."""
+        return orjson.dumps(payload)
+
+    async def _post(self, body: bytes, parse_response: bool = True) -> dict:
+        """
+        Post an already serialized command to the device.
+        
+        Args:
+            body: JSON encoded command payload
+            parse_response: Decode the JSON response (default: True)
             
         Returns:
             Response from the device
         """
-        async with aiohttp.ClientSession() as session:
-            url = f"{self.base_url}/post"
-            headers = {'Content-Type': 'application/json'}
-            print(f"Sending request to {url}")
-            print(f"Payload: {payload}")
-            async with session.post(url, json=payload, headers=headers) as response:
-                try:
-                    response_data = await response.json()
-                    print(f"Response: {response_data}")
-                    return response_data
-                except Exception:
-                    # If JSON parsing fails, just return success if status is 200
-                    success = {'success': response.status == 200}
-                    print(f"Failed to parse JSON response. Status: {response.status}")
-                    print(f"Response text: {await response.text()}")
-                    return success
+        session = self._get_session()
+        logger.debug("Sending request to %s", self._post_url)
+        async with session.post(self._post_url, data=body, headers=self._HEADERS) as response:
+            if not parse_response:
+                # Drain the body so the connection goes back to the pool
+                await response.read()
+                return {'success': response.status == 200}
+            try:
+                response_data = await response.json()
+                logger.debug("Response: %s", response_data)
+                return response_data
+            except Exception:
+                # If JSON parsing fails, just return success if status is 200
+                success = {'success': response.status == 200}
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Failed to parse JSON response. Status: %s", response.status)
+                    logger.debug("Response text: %s", await response.text())
+                return success
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            # Plain HTTP to a single device: no SSL context, small keep-alive pool
+            connector = aiohttp.TCPConnector(ssl=False, limit=4, limit_per_host=4, keepalive_timeout=120)
+            self._session = aiohttp.ClientSession(connector=connector, skip_auto_headers={'User-Agent'})
+        return self._session
+
+    async def close(self) -> None:
+        """Close the HTTP session and release its pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
                 
     async def reboot(self) -> dict:
         """Reboot the Divoom device using Device/SysReboot command."""
@@ -171,39 +324,57 @@ class DivoomPixoo64:
         }
         return await self.send_command(payload)
 
-    async def display_animation(self, image: Pixoo64Animation, pic_id: Optional[int] = None) -> None:
+    async def display_animation(self, image: Pixoo64Animation, pic_id: Optional[int] = None,
+                                frame_window: int = 1) -> None:
         """
         Display an animated image on the device.
         
-        Executes Draw/SendHttpGif command in a loop for each frame.
+        Executes Draw/SendHttpGif command for each frame, in PicOffset order.
+        The first and last frames are always sent on their own since they open
+        and complete the upload. The frames in between are sent in consecutive
+        windows of frame_window concurrent requests; the default of 1 keeps the
+        uploads strictly ordered.
         
         Args:
             image: Pixoo64Animation to display
             pic_id: Picture ID to use (auto-incremented if None)
+            frame_window: Number of intermediate frames in flight at once (default: 1)
             
         Raises:
-            ValueError: If no frames to display
+            ValueError: If no frames to display or frame_window is less than 1
         """
         if not image.encoded_frames:
             raise ValueError("No frames to display")
+        if frame_window < 1:
+            raise ValueError(f"frame_window must be at least 1, got {frame_window}")
         
         if pic_id is None:
             pic_id = self._get_next_pic_id()
         
         pic_num = min(len(image.encoded_frames), 60)
         pic_width = image.pic_width
-        for pic_offset, frame in enumerate(image.encoded_frames[:60]):
-            print(f"{len(frame)}")
-            payload = {
+        frames_b64 = await image.get_encoded_b64()
+        payloads = []
+        for pic_offset, frame_b64 in enumerate(frames_b64[:60]):
+            logger.debug("Frame %d encoded length: %d", pic_offset, len(frame_b64))
+            payloads.append({
                 "Command": "Draw/SendHttpGif",
                 "PicNum": pic_num,
                 "PicWidth": pic_width,
                 "PicOffset": pic_offset,
                 "PicID": pic_id,
                 "PicSpeed": image.frame_delay,
-                "PicData": base64.b64encode(frame).decode('utf-8')
-            }
-            await self.send_command(payload)
+                "PicData": frame_b64
+            })
+        # orjson encodes a frame body in microseconds, cheaper inline than an executor round trip
+        bodies = [self._encode_payload(p) for p in payloads]
+        await self._post(bodies[0], parse_response=False)
+        middle = bodies[1:-1]
+        for start in range(0, len(middle), frame_window):
+            await asyncio.gather(*(self._post(b, parse_response=False)
+                                   for b in middle[start:start + frame_window]))
+        if len(bodies) > 1:
+            await self._post(bodies[-1], parse_response=False)
 
     async def display_text(self, text: str) -> dict:
         """
@@ -281,7 +452,9 @@ class DivoomPixoo64:
     def draw_line(self, x0: int, y0: int, x1: int, y1: int, 
                   color: Tuple[int, int, int]) -> None:
         """
-        Draw a line from (x0, y0) to (x1, y1) using set_pixel.
+        Draw a line from (x0, y0) to (x1, y1).
+        
+        Pixels falling outside the display are clipped.
         
         Args:
             x0: Start X coordinate
@@ -290,32 +463,12 @@ class DivoomPixoo64:
             y1: End Y coordinate
             color: (R, G, B) tuple
         """
-        # Bresenham's line algorithm
-        dx = abs(x1 - x0)
-        dy = abs(y1 - y0)
-        x, y = x0, y0
-        sx = 1 if x0 < x1 else -1
-        sy = 1 if y0 < y1 else -1
-        if dx > dy:
-            err = dx // 2
-            while x != x1:
-                self.set_pixel(x, y, color)
-                err -= dy
-                if err < 0:
-                    y += sy
-                    err += dx
-                x += sx
-            self.set_pixel(x, y, color)  # Set last pixel
-        else:
-            err = dy // 2
-            while y != y1:
-                self.set_pixel(x, y, color)
-                err -= dx
-                if err < 0:
-                    x += sx
-                    err += dy
-                y += sy
-            self.set_pixel(x, y, color)  # Set last pixel
+        # Sample one point per step along the major axis, then store them all at once
+        n = max(abs(x1 - x0), abs(y1 - y0)) + 1
+        xs = np.floor(np.linspace(x0, x1, n) + 0.5).astype(np.intp)
+        ys = np.floor(np.linspace(y0, y1, n) + 0.5).astype(np.intp)
+        mask = (xs >= 0) & (xs < self._pixel_count_xy) & (ys >= 0) & (ys < self._pixel_count_xy)
+        self._buffer[ys[mask], xs[mask]] = self._pack_color(color)
 
     def draw_circle(self, cx: int, cy: int, radius: int, 
                    outline_color: Tuple[int, int, int], 
@@ -330,33 +483,28 @@ class DivoomPixoo64:
             outline_color: (R, G, B) tuple for the outline
             fill_color: (R, G, B) tuple for the fill (optional)
         """
-        # Fill (optional)
+        n = self._pixel_count_xy
+        r2 = radius * radius
+        # Outline: one octant of the midpoint circle (x rounded per row y), mirrored into all 8
+        oy = np.arange(radius + 1)
+        ox = np.floor(np.sqrt(r2 - oy * oy) + 0.5).astype(np.intp)
+        keep = ox >= oy
+        ox, oy = ox[keep], oy[keep]
+        px = cx + np.concatenate((ox, -ox, ox, -ox, oy, -oy, oy, -oy))
+        py = cy + np.concatenate((oy, oy, -oy, -oy, ox, ox, -ox, -ox))
+        inside = (px >= 0) & (px < n) & (py >= 0) & (py < n)
+        px, py = px[inside], py[inside]
+        # Fill (optional): distance mask over the bounding box clipped to the display,
+        # minus the outline pixels so no pixel is written twice
         if fill_color is not None:
-            for y_off in range(-radius, radius + 1):
-                for x_off in range(-radius, radius + 1):
-                    if x_off * x_off + y_off * y_off <= radius * radius:
-                        px, py = cx + x_off, cy + y_off
-                        if 0 <= px < self._pixel_count_xy and 0 <= py < self._pixel_count_xy:
-                            self.set_pixel(px, py, fill_color)
-        # Midpoint circle algorithm for outline
-        x = radius
-        y = 0
-        d = 1 - radius
-        outline_points = set()
-        while x >= y:
-            outline_points.update([
-                (cx + x, cy + y), (cx - x, cy + y), (cx + x, cy - y), (cx - x, cy - y),
-                (cx + y, cy + x), (cx - y, cy + x), (cx + y, cy - x), (cx - y, cy - x)
-            ])
-            y += 1
-            if d < 0:
-                d += 2 * y + 1
-            else:
-                x -= 1
-                d += 2 * (y - x) + 1
-        for px, py in outline_points:
-            if 0 <= px < self._pixel_count_xy and 0 <= py < self._pixel_count_xy:
-                self.set_pixel(px, py, outline_color)
+            x_lo, x_hi = max(cx - radius, 0), min(cx + radius + 1, n)
+            y_lo, y_hi = max(cy - radius, 0), min(cy + radius + 1, n)
+            if x_lo < x_hi and y_lo < y_hi:
+                yy, xx = np.ogrid[y_lo - cy:y_hi - cy, x_lo - cx:x_hi - cx]
+                fill_mask = xx * xx + yy * yy <= r2
+                fill_mask[py - y_lo, px - x_lo] = False
+                self._buffer[y_lo:y_hi, x_lo:x_hi][fill_mask] = self._pack_color(fill_color)
+        self._buffer[py, px] = self._pack_color(outline_color)
 
     def draw_rectangle(self, x0: int, y0: int, x1: int, y1: int,
                       outline_color: Tuple[int, int, int],
@@ -372,19 +520,25 @@ class DivoomPixoo64:
             outline_color: (R, G, B) tuple for the outline
             fill_color: (R, G, B) tuple for the fill (optional)
         """
+        x0, x1 = sorted((x0, x1))
+        y0, y1 = sorted((y0, y1))
+        n = self._pixel_count_xy
+        # Clip spans to the display (negative slice bounds would wrap around)
+        xs, xe = max(x0, 0), min(x1 + 1, n)
+        ys, ye = max(y0, 0), min(y1 + 1, n)
+        if xs >= xe or ys >= ye:
+            return
         # Fill (optional)
         if fill_color is not None:
-            for y in range(min(y0, y1) + 1, max(y0, y1)):
-                for x in range(min(x0, x1) + 1, max(x0, x1)):
-                    if 0 <= x < self._pixel_count_xy and 0 <= y < self._pixel_count_xy:
-                        self.set_pixel(x, y, fill_color)
+            self._buffer[max(y0 + 1, 0):min(y1, n), max(x0 + 1, 0):min(x1, n)] = self._pack_color(fill_color)
         # Outline
-        for x in range(min(x0, x1), max(x0, x1) + 1):
-            for y in [min(y0, y1), max(y0, y1)]:
-                if 0 <= x < self._pixel_count_xy and 0 <= y < self._pixel_count_xy:
-                    self.set_pixel(x, y, outline_color)
-        for y in range(min(y0, y1), max(y0, y1) + 1):
-            for x in [min(x0, x1), max(x0, x1)]:
-                if 0 <= x < self._pixel_count_xy and 0 <= y < self._pixel_count_xy:
-                    self.set_pixel(x, y, outline_color)
+        outline = self._pack_color(outline_color)
+        if y0 >= 0:
+            self._buffer[y0, xs:xe] = outline
+        if y1 < n:
+            self._buffer[y1, xs:xe] = outline
+        if x0 >= 0:
+            self._buffer[ys:ye, x0] = outline
+        if x1 < n:
+            self._buffer[ys:ye, x1] = outline
 
@@ -31,30 +31,35 @@ class AnimationManager:
     def __init__(self) -> None:
         """Initialize the animation manager."""
         self.current_animation: List[AnimationFrame] = []
-        self.next_animation: List[AnimationFrame] = []
+        self.next_animation: Dict[int, AnimationFrame] = {}
         self.current_frame: int = 0
         self.frame_delay: int = 100
         self.receiving_frames: bool = False
+        self.frame_ready = asyncio.Event()
         
     def start_new_animation(self) -> None:
         """Start receiving a new animation sequence."""
         self.receiving_frames = True
-        self.next_animation = []
+        self.next_animation = {}
         
-    def add_frame(self, frame_data: np.ndarray) -> None:
+    def add_frame(self, pic_offset: int, frame_data: np.ndarray) -> None:
         """
         Add a new frame to the next_animation buffer.
         
+        Frames may arrive out of order, so they are keyed by their offset.
+        
         Args:
+            pic_offset: Position of the frame within the animation
             frame_data: Frame data as numpy array
         """
-        self.next_animation.append(AnimationFrame(frame_data))
+        self.next_animation[pic_offset] = AnimationFrame(frame_data)
         
     def finalize_animation(self) -> None:
         """Finalize the animation by moving next_animation to current_animation."""
         self.current_frame = 0
-        self.current_animation = self.next_animation
+        self.current_animation = [self.next_animation[i] for i in sorted(self.next_animation)]
         self.receiving_frames = False
+        self.frame_ready.set()
         
     def get_current_frame(self) -> Optional[np.ndarray]:
         """
@@ -94,6 +99,9 @@ class DisplayManager:
         pygame.display.set_caption("Pixoo64 Simulator")
         self.screen.fill((0, 0, 0))
         pygame.display.flip()
+        # Reused for every frame instead of allocating new surfaces per update
+        self._surface = pygame.Surface((64, 64))
+        self._scaled = pygame.Surface((self.screen_size, self.screen_size))
         
     def update_display(self, frame: np.ndarray) -> None:
         """
@@ -102,17 +110,16 @@ class DisplayManager:
         Args:
             frame: Frame data as numpy array
         """
-        # Rotate frame 90 degrees clockwise and flip it
-        frame = np.rot90(frame, k=-1)
-        frame = np.flipud(np.fliplr(frame))
+        # Rotate frame 90 degrees clockwise and flip it, i.e. np.flipud(np.fliplr(np.rot90(frame, k=-1))),
+        # expressed as a single strided view without copying
+        frame = frame.transpose(1, 0, 2)[::-1]
         
-        # Convert numpy array to pygame surface
-        surface = pygame.Surface((64, 64))
-        pygame.surfarray.blit_array(surface, frame)
+        # Copy the frame into the cached surface
+        pygame.surfarray.blit_array(self._surface, frame)
         
         # Scale up the surface
-        scaled = pygame.transform.scale(surface, (self.screen_size, self.screen_size))
-        self.screen.blit(scaled, (0, 0))
+        pygame.transform.scale(self._surface, (self.screen_size, self.screen_size), self._scaled)
+        self.screen.blit(self._scaled, (0, 0))
         pygame.display.flip()
         
     def cleanup(self) -> None:
@@ -122,6 +129,11 @@ class DisplayManager:
 class Pixoo64Simulator:
     """Main simulator class that handles HTTP requests and display management."""
     
+    # Longest wait between pygame event polls, keeps the window responsive while idle
+    _EVENT_POLL_INTERVAL = 0.1
+    # Shortest time between animation frames, so a PicSpeed of 0 cannot spin the loop
+    _MIN_FRAME_INTERVAL = 1 / 60
+    
     def __init__(self, port: int = 80) -> None:
         """
         Initialize the simulator.
@@ -174,21 +186,16 @@ class Pixoo64Simulator:
             logger.error("No PicData provided")
             return
             
-        # Decode base64 data and convert to RGB image
-        if isinstance(pic_data, str):
-            frame_data = base64.b64decode(pic_data)
-        else:
-            frame_data = pic_data
-            
-        frame_array = np.frombuffer(frame_data, dtype=np.uint8)
-        frame_array = frame_array.reshape((64, 64, 3))
+        # Decode base64 data in a worker thread to keep the request handler responsive
+        loop = asyncio.get_running_loop()
+        frame_array = await loop.run_in_executor(None, self._decode_frame, pic_data)
         
         # Start receiving new animation
         if pic_offset == 0:
             self.animation_manager.start_new_animation()
         
         # Add frame
-        self.animation_manager.add_frame(frame_array)
+        self.animation_manager.add_frame(pic_offset, frame_array)
         logger.info(f"Received frame {pic_offset + 1}/{pic_num}")
         
         # Finalize if last frame
@@ -196,9 +203,36 @@ class Pixoo64Simulator:
             self.animation_manager.finalize_animation()
             logger.info("Animation update complete")
 
+    @staticmethod
+    def _decode_frame(pic_data: Union[str, bytes]) -> np.ndarray:
+        """
+        Decode PicData into an RGB frame.
+        
+        The frame is only ever read (blit_array copies it into a surface), so
+        the read-only view onto the decoded bytes is used without a copy.
+        
+        Args:
+            pic_data: Base64 encoded or raw frame data
+            
+        Returns:
+            Frame data as numpy array of shape (64, 64, 3)
+        """
+        if isinstance(pic_data, str):
+            frame_data = base64.b64decode(pic_data)
+        else:
+            frame_data = pic_data
+        return np.frombuffer(frame_data, dtype=np.uint8).reshape((64, 64, 3))
+
     async def run_display(self) -> None:
-        """Run the display loop."""
-        last_frame_time = time.time()
+        """
+        Run the display loop.
+        
+        Instead of polling at a fixed rate, the loop sleeps until a new animation
+        is finalized, the next frame of a running animation is due, or pygame
+        events need to be polled again, whichever comes first.
+        """
+        frame_ready = self.animation_manager.frame_ready
+        next_frame_time: Optional[float] = None
         
         while self.running:
             for event in pygame.event.get():
@@ -206,15 +240,26 @@ class Pixoo64Simulator:
                     self.running = False
                     return
 
-            current_time = time.time()
-            if current_time - last_frame_time >= (self.animation_manager.frame_delay / 1000.0):
+            current_time = time.monotonic()
+            if frame_ready.is_set() or (next_frame_time is not None and current_time >= next_frame_time):
+                frame_ready.clear()
+                next_frame_time = None
                 frame = self.animation_manager.get_current_frame()
                 if frame is not None:
                     self.display_manager.update_display(frame)
                     self.animation_manager.advance_frame()
-                last_frame_time = current_time
+                    # A single frame stays on screen, only animations need a timer
+                    if len(self.animation_manager.current_animation) > 1:
+                        frame_interval = max(self.animation_manager.frame_delay / 1000.0, self._MIN_FRAME_INTERVAL)
+                        next_frame_time = current_time + frame_interval
             
-            await asyncio.sleep(1/60)
+            timeout = self._EVENT_POLL_INTERVAL
+            if next_frame_time is not None:
+                timeout = min(timeout, max(next_frame_time - time.monotonic(), 0.0))
+            try:
+                await asyncio.wait_for(frame_ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
 
     async def start(self) -> None:
         """Start the simulator."""